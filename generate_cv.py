@@ -7,47 +7,69 @@ This script reads personal and professional information from a YAML file
 and generates a professional CV in DOCX format optimized for ATS systems.
 """
 
+import hashlib
+import importlib.util
 import logging
+import logging.handlers
 import os
+import pickle
+import re
+import struct
 import sys
-from datetime import datetime
+import time
+import zipfile
+from collections import Counter, defaultdict
+from functools import lru_cache
+from io import BytesIO, StringIO
+from itertools import islice
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, List, Any, Optional
 
-import yaml
+import docx
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.shared import OxmlElement, qn
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.pkgwriter import PackageWriter
+from docx.oxml.ns import nsdecls
+from docx.oxml.parser import parse_xml
+from docx.oxml.shared import qn
+from docx.text.paragraph import Paragraph
+from lxml import etree
 
-# Configure logging first
+# Configure logging first. The log file is written in batches through a
+# MemoryHandler, which flushes straight away once an error is logged
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+_log_file_handler = logging.FileHandler('cv_generation.log', delay=True)
+_log_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+_log_buffer = logging.handlers.MemoryHandler(1024, flushLevel=logging.ERROR, target=_log_file_handler)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('cv_generation.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    format=LOG_FORMAT,
+    handlers=[_log_buffer, logging.StreamHandler(sys.stdout)]
 )
 logger = logging.getLogger(__name__)
 
-# PDF generation imports
-try:
-    import weasyprint
-    WEASYPRINT_AVAILABLE = True
+# PDF generation backends: only check that they are installed here, and import
+# them when a PDF is actually generated (see _import_pdf_backend)
+WEASYPRINT_AVAILABLE = importlib.util.find_spec('weasyprint') is not None
+if WEASYPRINT_AVAILABLE:
     logger.info("WeasyPrint available for PDF generation")
-except ImportError:
-    WEASYPRINT_AVAILABLE = False
+else:
     logger.warning("WeasyPrint not available. PDF generation will be disabled.")
 
-try:
-    import pdfkit
-    PDFKIT_AVAILABLE = True
+PDFKIT_AVAILABLE = importlib.util.find_spec('pdfkit') is not None
+if PDFKIT_AVAILABLE:
     logger.info("pdfkit available for PDF generation")
-except ImportError:
-    PDFKIT_AVAILABLE = False
+else:
     logger.warning("pdfkit not available. PDF generation will be disabled.")
 
+# orjson speeds up the optional JSON export of the CV data; fall back to the stdlib.
+# Like the PDF backends it is only imported when an export is read or written
+ORJSON_AVAILABLE = importlib.util.find_spec('orjson') is not None
+
 # Try to import python-dotenv for environment variable loading
 try:
     from dotenv import load_dotenv
@@ -56,6 +78,259 @@ except ImportError:
     DOTENV_AVAILABLE = False
     logger.warning("python-dotenv not available. Environment variables must be set manually.")
 
+# Page margins and paragraph spacing (1 inch margins for ATS compatibility)
+PAGE_MARGIN = Inches(1)
+BODY_SPACE_AFTER = Pt(3)
+HEADING_SPACE_AFTER = Pt(6)
+# Gap closing a block (summary, job, entry); about the height of a blank body line
+BLOCK_SPACE_AFTER = Pt(18)
+NO_SPACE = Pt(0)
+
+# Centered alignment for the name and contact block
+CENTER = WD_ALIGN_PARAGRAPH.CENTER
+
+# White text colour used for the hidden secret message
+WHITE = RGBColor(255, 255, 255)
+SECRET_FONT_SIZE = Pt(1)
+SECRET_STYLE = 'CV Secret Message'
+
+# Run markup used by _flush_paragraphs when building the body XML
+UNDERLINED_RUN_START = '<w:r><w:rPr><w:u w:val="single"/></w:rPr>'
+RUN_BREAKS = re.compile(r'([\t\n\r])')
+RUN_BREAK_XML = {'\t': '<w:tab/>', '\n': '<w:br/>', '\r': '<w:br/>'}
+# Control characters XML cannot represent; stripped from user text before it is written
+CONTROL_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Links in the HTML used for PDF output, found in a single pass by _make_links_clickable.
+# At any position the alternatives are tried in order: emails, URLs, labelled
+# profile links (LinkedIn:, GitHub:, Website:), then phone numbers
+LINK_PATTERN = re.compile(
+    r'(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+    r'|(?P<url>https?://[^\s<>"]+)'
+    # A phone number right after the label is linked as a phone number
+    r'|(?P<label>(?P<site>LinkedIn|GitHub|Website):(?!\s*\+?[\d\s\-\(\)]{10,})\s*)'
+    r'(?:(?P<site_url>https?://[^\s<>"]+)'
+    # A bare value that is really an email address is left to the email alternative
+    r'|(?![a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})(?P<site_bare>[^\s<>"]+))'
+    r'|(?P<phone>\+?[\d\s\-\(\)]{10,})'
+)
+
+# Every link needs an '@' (email), a ':' (URL or profile label) or a digit (phone)
+DIGITS = frozenset('0123456789')
+
+
+def _link_replacement(match) -> str:
+    """Build the HTML link for a LINK_PATTERN match."""
+    kind = match.lastgroup
+    value = match.group(kind)
+    if kind == 'email':
+        return f'<a href="mailto:{value}">{value}</a>'
+    if kind == 'phone':
+        return f'<a href="tel:{value}">{value}</a>'
+    if kind == 'url':
+        return f'<a href="{value}" target="_blank">{value}</a>'
+    if kind == 'site_url':
+        return f'{match.group("label")}<a href="{value}" target="_blank">{value}</a>'
+    # Bare profile address: normalise the label and add the scheme
+    return f'{match.group("site")}: <a href="https://{value}" target="_blank">{value}</a>'
+
+
+# Page skeleton and stylesheet for the HTML rendered to PDF
+HTML_CSS = """\
+body {
+    font-family: 'Arial', 'Helvetica', sans-serif;
+    font-size: 11pt;
+    line-height: 1.5;
+    margin: 0.8in;
+    color: #333;
+    background-color: #ffffff;
+}
+h1 {
+    font-size: 24pt;
+    font-weight: bold;
+    text-align: center;
+    margin-bottom: 20pt;
+    margin-top: 0;
+    color: #2c3e50;
+    border-bottom: 2px solid #3498db;
+    padding-bottom: 10pt;
+}
+h2 {
+    font-size: 16pt;
+    font-weight: bold;
+    margin-top: 24pt;
+    margin-bottom: 12pt;
+    color: #2c3e50;
+    border-left: 4px solid #3498db;
+    padding-left: 10pt;
+}
+h3 {
+    font-size: 13pt;
+    font-weight: bold;
+    margin-top: 16pt;
+    margin-bottom: 8pt;
+    color: #34495e;
+}
+p {
+    margin-bottom: 8pt;
+    text-align: justify;
+}
+ul {
+    margin-bottom: 12pt;
+    padding-left: 20pt;
+}
+li {
+    margin-bottom: 4pt;
+    line-height: 1.4;
+}
+.contact-info {
+    text-align: center;
+    margin-bottom: 20pt;
+    font-size: 10pt;
+    color: #7f8c8d;
+}
+.contact-info a {
+    color: #3498db;
+    text-decoration: none;
+}
+.contact-info a:hover {
+    text-decoration: underline;
+}
+.date-range {
+    font-style: italic;
+    color: #7f8c8d;
+    font-size: 10pt;
+}
+.company-role {
+    font-weight: bold;
+    color: #2c3e50;
+}
+.achievement {
+    margin-left: 15pt;
+    position: relative;
+}
+.achievement:before {
+    content: "•";
+    color: #3498db;
+    font-weight: bold;
+    position: absolute;
+    left: -15pt;
+}
+ul {
+    list-style-type: none;
+    padding-left: 0;
+}
+.secret-message {
+    color: #ffffff !important;
+    font-size: 1pt;
+    margin: 0;
+    padding: 0;
+    line-height: 0;
+    opacity: 1;
+}
+"""
+HTML_HEAD = (
+    "<!DOCTYPE html>\n<html><head>\n<meta charset='UTF-8'>\n<style>\n"
+    + HTML_CSS
+    + "</style>\n</head><body>\n"
+)
+# Same skeleton without the inline stylesheet; WeasyPrint gets it pre-parsed
+HTML_HEAD_UNSTYLED = "<!DOCTYPE html>\n<html><head>\n<meta charset='UTF-8'>\n</head><body>\n"
+HTML_TAIL = "</body></html>\n"
+# Body paragraphs, walked directly when rendering the HTML
+W_P = qn('w:p')
+# HTML tags for the heading paragraph styles
+HTML_HEADING_TAGS = {'Heading 1': 'h1', 'Heading 2': 'h2', 'Heading 3': 'h3'}
+
+# Date ranges like "2024-10 - Present" or "2023-01 - 2024-12"
+DATE_RANGE_PATTERN = re.compile(r'\d{4}-\d{2}\s*-\s*(Present|\d{4}-\d{2})')
+
+# Qualified names for the hyperlink markup built in _add_hyperlink
+W_HYPERLINK = qn('w:hyperlink')
+W_R = qn('w:r')
+W_RPR = qn('w:rPr')
+W_COLOR = qn('w:color')
+W_U = qn('w:u')
+W_T = qn('w:t')
+W_VAL = qn('w:val')
+R_ID = qn('r:id')
+HYPERLINK_COLOR = '0563C1'
+
+# Theme font attributes stripped from style rFonts so explicit fonts apply
+THEME_FONT_ATTRS = tuple(qn(attr) for attr in ('w:asciiTheme', 'w:hAnsiTheme',
+                                               'w:eastAsiaTheme', 'w:cstheme'))
+# Explicit East Asian and complex-script font attributes set alongside them
+W_EAST_ASIA = qn('w:eastAsia')
+W_CS = qn('w:cs')
+
+# Private python-docx PackageWriter helpers used by _save_uncompressed
+PACKAGE_WRITER_INTERNALS = ('_write_content_types_stream', '_write_pkg_rels', '_write_parts')
+
+# Parsed YAML data is cached here, keyed by the source file's path, mtime and size
+CACHE_DIR = Path('.cache')
+
+# Upper bound on the YAML structure problems reported in one run
+MAX_VALIDATION_ERRORS = 50
+
+# python-docx's default template, read once so each new document opens from memory
+with open(Path(docx.__file__).parent / 'templates' / 'default.docx', 'rb') as _template_file:
+    DEFAULT_TEMPLATE = _template_file.read()
+
+
+
+def _xml_escape(text: str) -> str:
+    """Escape text for XML content or a double-quoted attribute value."""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
+
+
+# Contact lines and dates repeat across sections and across CVs in a batch
+@lru_cache(maxsize=512)
+def _make_links_clickable(text: str) -> str:
+    """Convert email addresses, phone numbers, and URLs to clickable links."""
+    # Most bullets and summaries contain no link at all; skip the regex for them
+    if '@' not in text and ':' not in text and DIGITS.isdisjoint(text):
+        return text
+    return LINK_PATTERN.sub(_link_replacement, text)
+
+
+@lru_cache(maxsize=512)
+def _is_date_range(text: str) -> bool:
+    """Check if text looks like a date range (e.g., "2024-10 - Present")."""
+    return bool(DATE_RANGE_PATTERN.match(text.strip()))
+
+
+@lru_cache(maxsize=None)
+def _import_pdf_backend(name: str):
+    """
+    Import a PDF generation backend on first use.
+    
+    Args:
+        name: Module name, 'weasyprint' or 'pdfkit'
+        
+    Returns:
+        The imported module, or None if it could not be loaded
+    """
+    try:
+        return importlib.import_module(name)
+    except (ImportError, OSError) as e:
+        # WeasyPrint raises OSError when its system libraries (Pango etc.) are missing
+        logger.warning("Could not load %s for PDF generation: %s", name, e)
+        return None
+
+
+@lru_cache(maxsize=None)
+def _weasyprint_stylesheet():
+    """
+    Parse the PDF stylesheet once and share it across WeasyPrint renders.
+    
+    Returns:
+        tuple: (FontConfiguration, CSS) to pass to write_pdf
+    """
+    fonts = importlib.import_module('weasyprint.text.fonts')
+    font_config = fonts.FontConfiguration()
+    css = _import_pdf_backend('weasyprint').CSS(string=HTML_CSS, font_config=font_config)
+    return font_config, css
+
 
 class CVGenerator:
     """
@@ -63,20 +338,87 @@ class CVGenerator:
     Optimized for ATS (Applicant Tracking System) compatibility.
     """
     
-    def __init__(self, yaml_file: str = "data/master_cv.yaml"):
+    __slots__ = (
+        'yaml_file', 'compress', 'data', 'doc', 'config', 'personal_info',
+        '_output_dir', '_pending', '_timestamp', '_contact_lines', '_yaml_stat'
+    )
+    
+    # Sections in their default order, with the methods that render them
+    _SECTIONS = (
+        ('personal_info', 'add_personal_info'),
+        ('summary', 'add_summary'),
+        ('experience', 'add_experience'),
+        ('education', 'add_education'),
+        ('skills', 'add_skills'),
+        ('certifications', 'add_certifications'),
+        ('projects', 'add_projects'),
+        ('languages', 'add_languages'),
+        ('additional_sections', 'add_additional_sections')
+    )
+    _SECTION_METHOD_NAMES = dict(_SECTIONS)
+    
+    # Per-section entry fields that must be lists of strings
+    _ENTRY_LIST_FIELDS = {
+        'experience': ('achievements', 'technologies'),
+        'education': ('relevant_coursework',),
+        'projects': ('technologies',)
+    }
+    
+    # Personal information fields and the environment variables they are read from
+    _PERSONAL_ENV_VARS = (
+        ('name', 'CV_NAME'),
+        ('email', 'CV_EMAIL'),
+        ('phone', 'CV_PHONE'),
+        ('location', 'CV_LOCATION'),
+        ('linkedin', 'CV_LINKEDIN'),
+        ('website', 'CV_WEBSITE'),
+        ('github', 'CV_GITHUB')
+    )
+    
+    # Contact block fields in display order: (field, label, underlined)
+    _CONTACT_FIELDS = (
+        ('email', None, True),
+        ('phone', None, True),
+        ('location', None, False),
+        ('linkedin', 'LinkedIn', True),
+        ('website', 'Website', True),
+        ('github', 'GitHub', True)
+    )
+    
+    # Heading templates for entry-based sections, filled via str.format_map
+    _EXP_HEADER = "{role} - {company}"
+    _EDU_HEADER = "{degree} - {institution}"
+    _CERT_HEADER = "{name} - {issuer}"
+    _LANG_LINE = "{language} - {proficiency}"
+    _VOL_HEADER = "{role} - {organization}"
+    _PUB_HEADER = "{title} - {publication}"
+    
+    def __init__(self, yaml_file: str = "data/master_cv.yaml", compress: bool = True,
+                 output_dir: str = "output"):
         """
         Initialize CV generator with YAML data file.
         
         Args:
             yaml_file: Path to YAML file containing CV data
+            compress: Write the DOCX with DEFLATE compression; False stores parts
+                uncompressed, which saves faster but gives a much larger file
+            output_dir: Directory the generated CV files are written to
         """
         self.yaml_file = yaml_file
+        self.compress = compress
+        self._output_dir = Path(output_dir)
+        self._output_dir.mkdir(parents=True, exist_ok=True)
         self.data = None
         self.doc = None
         self.config = {}
         self.personal_info = {}
+        self._pending = []
+        self._yaml_stat = None
         
-        logger.info(f"Initializing CV generator with file: {yaml_file}")
+        # Timestamp used in output filenames, fixed once per generator
+        self._timestamp = time.strftime('%Y%m%d_%H%M%S')
+        
+        logger.info("Initializing CV generator with file: %s", yaml_file)
         
         # Load environment variables for personal information
         self.load_personal_info_from_env()
@@ -91,32 +433,32 @@ class CVGenerator:
         if os.path.exists(env_file):
             if DOTENV_AVAILABLE:
                 load_dotenv(env_file)
-                logger.info(f"Loaded environment variables from {env_file}")
+                logger.info("Loaded environment variables from %s", env_file)
             else:
-                logger.warning(f"Found {env_file} but python-dotenv not available. Please install it or set environment variables manually.")
+                logger.warning("Found %s but python-dotenv not available. Please install it or set environment variables manually.", env_file)
         else:
-            logger.info(f"No {env_file} file found, using system environment variables")
-        
-        # Load personal information from environment variables
-        self.personal_info = {
-            'name': os.getenv('CV_NAME', ''),
-            'email': os.getenv('CV_EMAIL', ''),
-            'phone': os.getenv('CV_PHONE', ''),
-            'location': os.getenv('CV_LOCATION', ''),
-            'linkedin': os.getenv('CV_LINKEDIN', ''),
-            'website': os.getenv('CV_WEBSITE', ''),
-            'github': os.getenv('CV_GITHUB', '')
-        }
+            logger.info("No %s file found, using system environment variables", env_file)
+        
+        # Load personal information from a single snapshot of the environment
+        environ = dict(os.environ)
+        self.personal_info = {field: environ.get(var, '') for field, var in self._PERSONAL_ENV_VARS}
+        
+        # Contact block lines for add_personal_info, built once from the non-empty fields
+        personal = self.personal_info
+        self._contact_lines = [
+            (f"{label}: {personal[field]}" if label else personal[field], underline)
+            for field, label, underline in self._CONTACT_FIELDS if personal[field]
+        ]
         
         # Validate required fields
         required_fields = ['name', 'email']
         missing_fields = [field for field in required_fields if not self.personal_info[field]]
         
         if missing_fields:
-            logger.error(f"Missing required personal information: {', '.join(missing_fields)}")
+            logger.error("Missing required personal information: %s", ', '.join(missing_fields))
             logger.error("Please set the following environment variables:")
             for field in missing_fields:
-                logger.error(f"  CV_{field.upper()}")
+                logger.error("  CV_%s", field.upper())
             logger.error("Or create a personal_info.env file with these values.")
         else:
             logger.info("Personal information loaded successfully from environment variables")
@@ -125,80 +467,107 @@ class CVGenerator:
         """
         Validate the structure of the loaded YAML data.
         
+        At most MAX_VALIDATION_ERRORS problems are reported; with
+        cv_config.validation_fail_fast set, checking stops at the first one.
+        
         Returns:
             bool: True if structure is valid, False otherwise
         """
-        errors = []
+        if self.config.get('validation_fail_fast', False):
+            errors = list(islice(self._iter_validation_errors(), 1))
+        else:
+            errors = list(islice(self._iter_validation_errors(), MAX_VALIDATION_ERRORS))
+        
+        # Report errors
+        if errors:
+            logger.error("YAML structure validation failed:")
+            for error in errors:
+                logger.error("  - %s", error)
+            logger.error("\\nPlease fix these issues in your YAML file and try again.")
+            logger.error("\\nFor help with YAML structure, see data/example_cv.yaml")
+            return False
+        
+        return True
+    
+    def _iter_validation_errors(self):
+        """
+        Check the structure of the loaded YAML data lazily.
         
+        Yields:
+            str: A description of each structural problem found
+        """
         # Check required sections (personal_info is now loaded from environment variables)
         required_sections = []
         for section in required_sections:
             if section not in self.data:
-                errors.append(f"Missing required section: '{section}'")
+                yield f"Missing required section: '{section}'"
         
         # Personal information is now loaded from environment variables
         # Validate that we have the required personal info from environment
         required_personal_fields = ['name', 'email']
         missing_personal_fields = [field for field in required_personal_fields if not self.personal_info.get(field)]
         if missing_personal_fields:
-            errors.append(f"Missing required personal information from environment: {', '.join(missing_personal_fields)}")
+            yield f"Missing required personal information from environment: {', '.join(missing_personal_fields)}"
         
         # Validate list sections (experience, education, projects, languages, certifications)
         list_sections = ['experience', 'education', 'projects', 'languages', 'certifications']
         for section in list_sections:
-            if section in self.data:
-                if self.data[section] is None:
-                    # Empty section with just comments - this is OK
-                    continue
-                elif not isinstance(self.data[section], list):
-                    errors.append(f"'{section}' must be a list, got {type(self.data[section]).__name__}")
-                else:
-                    # Check each entry is a dictionary
-                    for i, item in enumerate(self.data[section]):
-                        if not isinstance(item, dict):
-                            errors.append(f"'{section}' entry {i+1} must be a dictionary, got {type(item).__name__}: {item}")
+            entries = self.data.get(section)
+            if entries is None:
+                # Missing, or an empty section with just comments - this is OK
+                continue
+            elif not isinstance(entries, list):
+                yield f"'{section}' must be a list, got {type(entries).__name__}"
+            else:
+                # Check each entry is a dictionary and its list fields hold strings
+                for i, item in enumerate(entries):
+                    if not isinstance(item, dict):
+                        yield f"'{section}' entry {i+1} must be a dictionary, got {type(item).__name__}: {item}"
+                        continue
+                    for field in self._ENTRY_LIST_FIELDS.get(section, ()):
+                        values = item.get(field)
+                        if not values:
+                            continue
+                        if not isinstance(values, list):
+                            yield f"'{section}' entry {i+1}: '{field}' must be a list, got {type(values).__name__}"
+                            continue
+                        if all(isinstance(value, str) for value in values):
+                            continue
+                        for j, value in enumerate(values):
+                            if not isinstance(value, str):
+                                yield f"'{section}' entry {i+1}: item {j+1} in '{field}' must be a string, got {type(value).__name__}: {value}"
         
         # Validate skills structure
         if 'skills' in self.data:
             skills = self.data['skills']
             if not isinstance(skills, dict):
-                errors.append("'skills' must be a dictionary with skill categories")
+                yield "'skills' must be a dictionary with skill categories"
             else:
                 for category, skill_list in skills.items():
                     if not isinstance(skill_list, list):
-                        errors.append(f"Skills category '{category}' must be a list, got {type(skill_list).__name__}")
-                    else:
+                        yield f"Skills category '{category}' must be a list, got {type(skill_list).__name__}"
+                    elif not all(isinstance(skill, str) for skill in skill_list):
+                        # Only walk the list again to report the offending items
                         for i, skill in enumerate(skill_list):
                             if not isinstance(skill, str):
-                                errors.append(f"Skill {i+1} in category '{category}' must be a string, got {type(skill).__name__}: {skill}")
+                                yield f"Skill {i+1} in category '{category}' must be a string, got {type(skill).__name__}: {skill}"
         
         # Validate additional_sections structure
         if 'additional_sections' in self.data:
             additional = self.data['additional_sections']
             if not isinstance(additional, dict):
-                errors.append("'additional_sections' must be a dictionary")
+                yield "'additional_sections' must be a dictionary"
             else:
                 for section_name, section_data in additional.items():
                     if section_name in ['volunteer', 'publications']:
                         if not isinstance(section_data, list):
-                            errors.append(f"'{section_name}' in additional_sections must be a list, got {type(section_data).__name__}")
+                            yield f"'{section_name}' in additional_sections must be a list, got {type(section_data).__name__}"
                             if isinstance(section_data, str) and section_data.lower() == 'pass':
-                                errors.append(f"'{section_name}' contains 'pass' - use empty list [] instead")
+                                yield f"'{section_name}' contains 'pass' - use empty list [] instead"
                         else:
                             for i, item in enumerate(section_data):
                                 if not isinstance(item, dict):
-                                    errors.append(f"'{section_name}' entry {i+1} must be a dictionary, got {type(item).__name__}: {item}")
-        
-        # Report errors
-        if errors:
-            logger.error("YAML structure validation failed:")
-            for error in errors:
-                logger.error(f"  - {error}")
-            logger.error("\\nPlease fix these issues in your YAML file and try again.")
-            logger.error("\\nFor help with YAML structure, see data/example_cv.yaml")
-            return False
-        
-        return True
+                                    yield f"'{section_name}' entry {i+1} must be a dictionary, got {type(item).__name__}: {item}"
     
     def load_data(self) -> bool:
         """
@@ -208,13 +577,22 @@ class CVGenerator:
             bool: True if data loaded successfully, False otherwise
         """
         try:
-            if not os.path.exists(self.yaml_file):
-                logger.error(f"YAML file not found: {self.yaml_file}")
+            # One stat serves as the existence check and as the key for the JSON export and cache
+            try:
+                yaml_stat = os.stat(self.yaml_file)
+            except FileNotFoundError:
+                logger.error("YAML file not found: %s", self.yaml_file)
                 logger.info("Please copy data/example_cv.yaml to data/master_cv.yaml and update with your information")
                 return False
+            self._yaml_stat = yaml_stat
             
-            with open(self.yaml_file, 'r', encoding='utf-8') as file:
-                self.data = yaml.safe_load(file)
+            self.data = self._load_json_export(yaml_stat)
+            if self.data is None:
+                self.data = self._load_cached_data(yaml_stat)
+            if self.data is None:
+                if not self._parse_yaml():
+                    return False
+                self._save_cached_data(yaml_stat)
             
             if not self.data:
                 logger.error("YAML file is empty or invalid")
@@ -230,32 +608,307 @@ class CVGenerator:
             logger.info("YAML data loaded successfully")
             return True
             
+        except Exception as e:
+            logger.error("Error loading data: %s", e)
+            return False
+    
+    def _parse_yaml(self) -> bool:
+        """
+        Parse the YAML file into self.data.
+        
+        PyYAML is imported here rather than at module level, so runs served from
+        the JSON export or the pickle cache never pay for importing it.
+        
+        Returns:
+            bool: True if the file was parsed, False on a YAML syntax error
+        """
+        import yaml
+        
+        # Prefer the libyaml-backed loader; fall back to the pure-Python one if the C extension is missing.
+        # The CV data is only read, never written back, so no round-trip loader is needed: anchors and
+        # aliases are resolved into plain values and comments are dropped.
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        
+        try:
+            # libyaml reads bytes directly and detects the encoding itself
+            with open(self.yaml_file, 'rb') as file:
+                self.data = yaml.load(file, Loader=loader)
+            return True
         except yaml.YAMLError as e:
-            logger.error(f"Error parsing YAML file: {e}")
+            logger.error("Error parsing YAML file: %s", e)
             logger.error("Please check your YAML syntax. Common issues:")
             logger.error("  - Incorrect indentation (use spaces, not tabs)")
             logger.error("  - Missing colons after keys")
             logger.error("  - Unquoted strings with special characters")
             logger.error("  - Using 'pass' instead of empty lists []")
             return False
-        except Exception as e:
-            logger.error(f"Error loading data: {e}")
-            return False
+    
+    def _load_json_export(self, yaml_stat: os.stat_result):
+        """
+        Load CV data from a JSON export next to the YAML file (see export_json).
+        
+        The export is only used when the YAML mtime and size recorded in it
+        still match the YAML file exactly.
+        
+        Args:
+            yaml_stat: Stat result of the YAML file
+            
+        Returns:
+            The exported data, or None if there is no up-to-date export
+        """
+        json_path = Path(self.yaml_file).with_suffix('.json')
+        try:
+            raw = json_path.read_bytes()
+            if ORJSON_AVAILABLE:
+                import orjson
+                export = orjson.loads(raw)
+            else:
+                import json
+                export = json.loads(raw)
+            # Exports from older versions have no source record and count as stale
+            if not isinstance(export, dict) or export.get('source') != self._export_source(yaml_stat):
+                return None
+            logger.info("Loaded CV data from JSON export: %s", json_path)
+            return export.get('data')
+        except (OSError, ValueError):
+            return None
+    
+    def _export_source(self, yaml_stat: os.stat_result) -> Dict[str, int]:
+        """Record of the YAML file a JSON export was made from, compared on load."""
+        return {'yaml_mtime_ns': yaml_stat.st_mtime_ns, 'yaml_size': yaml_stat.st_size}
+    
+    def export_json(self) -> str:
+        """
+        Write the loaded CV data to a JSON file next to the YAML file.
+        
+        Later runs read this export instead of parsing the YAML, as long as the
+        YAML file has not been modified since. The YAML's mtime and size at load
+        time are stored next to the data for that check.
+        
+        Returns:
+            str: Path to the JSON file, or empty string if the export failed
+        """
+        if not self.data:
+            logger.error("No CV data loaded to export")
+            return ""
+        
+        json_path = Path(self.yaml_file).with_suffix('.json')
+        try:
+            # Use the stat taken when the data was loaded, so a YAML edited since
+            # then is never recorded as the export's source
+            yaml_stat = self._yaml_stat or os.stat(self.yaml_file)
+            export = {'source': self._export_source(yaml_stat), 'data': self.data}
+            if ORJSON_AVAILABLE:
+                import orjson
+                json_path.write_bytes(orjson.dumps(export))
+            else:
+                import json
+                json_path.write_text(json.dumps(export, default=str), encoding='utf-8')
+            logger.info("Exported CV data to JSON: %s", json_path)
+            return str(json_path)
+        except (OSError, TypeError) as e:
+            logger.error("Error exporting CV data to JSON: %s", e)
+            return ""
+    
+    def _cache_key(self, yaml_stat: os.stat_result):
+        """
+        Build the cache file path and header for the current YAML file.
+        
+        Args:
+            yaml_stat: Stat result of the YAML file
+            
+        Returns:
+            tuple: (cache file path, header bytes encoding the YAML path, mtime and size)
+        """
+        # Files with the same name in different directories can share size and
+        # mtime (after cp -p, rsync -t or unpacking an archive), so key on the path too
+        yaml_path = os.fsencode(Path(self.yaml_file).resolve())
+        path_hash = hashlib.sha1(yaml_path).hexdigest()[:16]
+        cache_file = CACHE_DIR / f"{Path(self.yaml_file).name}.{path_hash}.pkl"
+        header = struct.pack('<qqI', yaml_stat.st_mtime_ns, yaml_stat.st_size, len(yaml_path)) + yaml_path
+        return cache_file, header
+    
+    def _load_cached_data(self, yaml_stat: os.stat_result):
+        """
+        Load previously parsed YAML data from the pickle cache.
+        
+        Args:
+            yaml_stat: Stat result of the YAML file
+            
+        Returns:
+            The cached data, or None if there is no cache for the current YAML file
+        """
+        try:
+            cache_file, header = self._cache_key(yaml_stat)
+            with open(cache_file, 'rb') as file:
+                if file.read(len(header)) != header:
+                    return None
+                data = pickle.load(file)
+            logger.debug("Loaded YAML data from cache: %s", cache_file)
+            return data
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+    
+    def _save_cached_data(self, yaml_stat: os.stat_result):
+        """Store the parsed YAML data in the pickle cache, keyed by the given YAML stat."""
+        try:
+            cache_file, header = self._cache_key(yaml_stat)
+            CACHE_DIR.mkdir(exist_ok=True)
+            # Write to a temporary file and rename so readers never see a partial cache
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as file:
+                file.write(header)
+                pickle.dump(self.data, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except (OSError, pickle.PicklingError) as e:
+            logger.debug("Could not write YAML cache: %s", e)
     
     def create_document(self):
         """Create a new Word document with ATS-friendly formatting."""
-        self.doc = Document()
+        self.doc = Document(BytesIO(DEFAULT_TEMPLATE))
+        self._pending = []
+        
+        # Italic paragraph style for dates, technologies and credential IDs
+        italic_style = self.doc.styles.add_style('CV Italic', WD_STYLE_TYPE.PARAGRAPH)
+        italic_style.base_style = self.doc.styles['Normal']
+        italic_style.font.italic = True
         
         # Set document margins (1 inch on all sides for ATS compatibility)
         sections = self.doc.sections
         for section in sections:
-            section.top_margin = Inches(1)
-            section.bottom_margin = Inches(1)
-            section.left_margin = Inches(1)
-            section.right_margin = Inches(1)
+            section.top_margin = PAGE_MARGIN
+            section.bottom_margin = PAGE_MARGIN
+            section.left_margin = PAGE_MARGIN
+            section.right_margin = PAGE_MARGIN
         
         logger.debug("Created new document with ATS-friendly margins")
     
+    def _emit(self, text: str = '', style: Optional[str] = None, alignment=None,
+              underline: bool = False):
+        """
+        Queue a paragraph for the document body.
+        
+        Paragraphs are buffered and written in one pass by _flush_paragraphs,
+        instead of going through python-docx's Paragraph API one at a time.
+        
+        Args:
+            text: Paragraph text; other YAML scalars (e.g. a year) are converted
+            style: Paragraph style name, e.g. 'Heading 2', 'List Bullet' or 'CV Italic'
+            alignment: Optional paragraph alignment
+            underline: Underline the text
+        """
+        # The XML is only built at flush time, outside the sections' error
+        # handling, so convert here rather than failing the whole document
+        if not isinstance(text, str):
+            text = str(text)
+        runs = ((text, underline),) if text else ()
+        self._pending.append((runs, style, alignment, None))
+    
+    def _end_block(self):
+        """
+        Leave a gap after the last queued paragraph.
+        
+        This replaces empty spacer paragraphs: the space is added to the
+        paragraph's own spacing, so the body holds no blank paragraphs.
+        """
+        if self._pending:
+            runs, style, alignment, _ = self._pending[-1]
+            self._pending[-1] = (runs, style, alignment, BLOCK_SPACE_AFTER)
+    
+    def _emit_lines(self, lines: List[tuple], alignment=None):
+        """
+        Queue a single paragraph whose lines are separated by line breaks.
+        
+        Args:
+            lines: (text, underline) pairs, one per line
+            alignment: Optional paragraph alignment
+        """
+        runs = []
+        for text, underline in lines:
+            if runs:
+                runs.append(('\n', False))
+            runs.append((text, underline))
+        self._pending.append((tuple(runs), None, alignment, None))
+    
+    def _flush_paragraphs(self):
+        """Build all queued paragraphs as one XML string and insert them into the body at once."""
+        if not self._pending:
+            return
+        
+        style_ids = {}
+        fragments = []
+        append = fragments.append
+        for runs, style, alignment, space_after in self._pending:
+            append('<w:p>')
+            if style or alignment is not None or space_after is not None:
+                # pPr children must follow the schema order: pStyle, spacing, jc
+                append('<w:pPr>')
+                if style:
+                    if style not in style_ids:
+                        style_ids[style] = _xml_escape(self.doc.styles[style].style_id)
+                    append(f'<w:pStyle w:val="{style_ids[style]}"/>')
+                if space_after is not None:
+                    append(f'<w:spacing w:after="{space_after.twips}"/>')
+                if alignment is not None:
+                    append(f'<w:jc w:val="{alignment.xml_value}"/>')
+                append('</w:pPr>')
+            for text, underline in runs:
+                append(UNDERLINED_RUN_START if underline else '<w:r>')
+                # Tabs and line breaks become <w:tab/> and <w:br/>, as python-docx's run text setter does
+                for piece in RUN_BREAKS.split(CONTROL_CHARS.sub('', text)):
+                    if piece in RUN_BREAK_XML:
+                        append(RUN_BREAK_XML[piece])
+                    elif piece:
+                        append(f'<w:t xml:space="preserve">{_xml_escape(piece)}</w:t>')
+                append('</w:r>')
+            append('</w:p>')
+        
+        # One parse for the whole batch instead of building each element separately
+        wrapper = parse_xml(f'<w:body {nsdecls("w")}>{"".join(fragments)}</w:body>')
+        elements = list(wrapper)
+        
+        # Paragraphs must stay ahead of the trailing section properties
+        body = self.doc.element.body
+        sect_pr = body.sectPr
+        index = body.index(sect_pr) if sect_pr is not None else len(body)
+        body[index:index] = elements
+        
+        logger.debug("Flushed %d paragraphs to document body", len(elements))
+        self._pending = []
+    
+    def _format_list(self, label: Optional[str], items: List[str]) -> str:
+        """
+        Format a list of items as a single comma-separated line.
+        
+        Args:
+            label: Optional label prefix, e.g. 'Technologies'
+            items: Items to join
+            
+        Returns:
+            str: 'Label: item1, item2' or just 'item1, item2' without a label
+        """
+        joined = ', '.join(items)
+        return f"{label}: {joined}" if label else joined
+    
+    def _format_entry(self, template: str, entry: Dict[str, Any],
+                      suffix_key: Optional[str] = None) -> str:
+        """
+        Fill an entry heading template, missing fields rendering as ''.
+        
+        Args:
+            template: Format string such as '{role} - {company}'
+            entry: Entry dictionary from the YAML data
+            suffix_key: Optional field appended as ' (value)' when set
+            
+        Returns:
+            str: The formatted heading
+        """
+        fields = defaultdict(str, entry)
+        text = template.format_map(fields)
+        if suffix_key and entry.get(suffix_key):
+            text += f" ({fields[suffix_key]})"
+        return text
+    
     def add_personal_info(self):
         """Add personal information section to the document."""
         if not self.personal_info:
@@ -265,69 +918,30 @@ class CVGenerator:
         personal = self.personal_info
         
         # Add name as main heading
-        name_para = self.doc.add_heading(personal.get('name', ''), level=1)
-        name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # Add contact information - each on separate line for better ATS parsing
-        if personal.get('email'):
-            email_para = self.doc.add_paragraph()
-            email_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            # Add hyperlink for email
-            self._add_hyperlink_simple(email_para, personal['email'], f"mailto:{personal['email']}")
-            
-        if personal.get('phone'):
-            phone_para = self.doc.add_paragraph()
-            phone_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            # Add hyperlink for phone
-            self._add_hyperlink_simple(phone_para, personal['phone'], f"tel:{personal['phone']}")
-            
-        if personal.get('location'):
-            location_para = self.doc.add_paragraph(personal['location'])
-            location_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-        if personal.get('linkedin'):
-            linkedin_para = self.doc.add_paragraph()
-            linkedin_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            # Add hyperlink for LinkedIn
-            self._add_hyperlink_simple(linkedin_para, f"LinkedIn: {personal['linkedin']}", personal['linkedin'])
-            
-        if personal.get('website'):
-            website_para = self.doc.add_paragraph()
-            website_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            # Add hyperlink for website
-            self._add_hyperlink_simple(website_para, f"Website: {personal['website']}", personal['website'])
-            
-        if personal.get('github'):
-            github_para = self.doc.add_paragraph()
-            github_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            # Add hyperlink for GitHub
-            self._add_hyperlink_simple(github_para, f"GitHub: {personal['github']}", personal['github'])
+        self._emit(personal.get('name', ''), style='Heading 1', alignment=CENTER)
+        
+        # Add contact information - each on a separate line for better ATS parsing,
+        # as line breaks within a single centered paragraph
+        if self._contact_lines:
+            self._emit_lines(self._contact_lines, alignment=CENTER)
         
-        logger.info(f"Added personal information for: {personal.get('name', 'Unknown')}")
+        logger.info("Added personal information for: %s", personal.get('name', 'Unknown'))
     
-    def _add_hyperlink_simple(self, paragraph, text: str, url: str):
+    def _add_hyperlink_simple(self, text: str, url: str, alignment=None):
         """
-        Add a simple hyperlink to a paragraph using a more reliable method.
+        Add a simple hyperlink paragraph using a more reliable method.
         
         Args:
-            paragraph: The paragraph object to add the hyperlink to
             text: The display text for the hyperlink
             url: The URL to link to
+            alignment: Optional paragraph alignment
         """
-        try:
-            # For now, just add the text with proper formatting
-            # TODO: Implement proper hyperlink functionality
-            run = paragraph.add_run(text)
-            run.font.color.rgb = None  # Use default color
-            run.font.underline = True
-            
-            # Log the hyperlink for debugging
-            logger.debug(f"Added hyperlink: {text} -> {url}")
-            
-        except Exception as e:
-            logger.warning(f"Could not add hyperlink for {text}: {e}")
-            # Fallback: just add the text without hyperlink
-            paragraph.add_run(text)
+        # For now, just add the text with proper formatting
+        # TODO: Implement proper hyperlink functionality
+        self._emit(text, alignment=alignment, underline=True)
+        
+        # Log the hyperlink for debugging
+        logger.debug("Added hyperlink: %s -> %s", text, url)
     
     def _add_hyperlink(self, paragraph, text: str, url: str):
         """
@@ -342,381 +956,278 @@ class CVGenerator:
             # Clear the paragraph first
             paragraph.clear()
             
-            # Create hyperlink element
-            hyperlink = OxmlElement('w:hyperlink')
-            hyperlink.set(qn('r:id'), url)
+            # External relationship for the URL; the hyperlink refers to it by id
+            r_id = paragraph.part.relate_to(url, RT.HYPERLINK, is_external=True)
             
-            # Create run element
-            run = OxmlElement('w:r')
-            run_props = OxmlElement('w:rPr')
+            # Build w:hyperlink/w:r(w:rPr, w:t) directly with lxml
+            hyperlink = etree.SubElement(paragraph._p, W_HYPERLINK, {R_ID: r_id})
+            run = etree.SubElement(hyperlink, W_R)
+            run_props = etree.SubElement(run, W_RPR)
             
             # Set hyperlink styling (blue color, underlined)
-            color = OxmlElement('w:color')
-            color.set(qn('w:val'), '0563C1')
-            run_props.append(color)
-            
-            underline = OxmlElement('w:u')
-            underline.set(qn('w:val'), 'single')
-            run_props.append(underline)
-            
-            run.append(run_props)
+            etree.SubElement(run_props, W_COLOR, {W_VAL: HYPERLINK_COLOR})
+            etree.SubElement(run_props, W_U, {W_VAL: 'single'})
             
             # Add text
-            text_elem = OxmlElement('w:t')
-            text_elem.text = text
-            run.append(text_elem)
-            
-            hyperlink.append(run)
-            paragraph._p.append(hyperlink)
+            etree.SubElement(run, W_T).text = text
             
         except Exception as e:
-            logger.warning(f"Could not add hyperlink for {text}: {e}")
+            logger.warning("Could not add hyperlink for %s: %s", text, e)
             # Fallback: just add the text without hyperlink
             paragraph.add_run(text)
     
     def add_summary(self):
         """Add professional summary section."""
-        if 'summary' not in self.data:
-            logger.debug("No summary found in YAML data")
-            return
-        
-        summary_text = self.data['summary'].strip()
+        summary_text = (self.data.get('summary') or '').strip()
         if not summary_text:
+            logger.debug("No summary found in YAML data")
             return
         
-        self.doc.add_heading('Professional Summary', level=2)
-        summary_para = self.doc.add_paragraph(summary_text)
+        self._emit('Professional Summary', style='Heading 2')
+        self._emit(summary_text)
         # Add small spacing after summary
-        self.doc.add_paragraph()
+        self._end_block()
         
         logger.info("Added professional summary section")
     
     def add_experience(self):
         """Add work experience section."""
-        if 'experience' not in self.data:
-            logger.debug("No experience found in YAML data")
-            return
-        
-        experiences = self.data['experience']
+        experiences = self.data.get('experience')
         if not experiences:
+            logger.debug("No experience found in YAML data")
             return
         
-        self.doc.add_heading('Professional Experience', level=2)
+        self._emit('Professional Experience', style='Heading 2')
         
         try:
-            for i, exp in enumerate(experiences):
-                # Check if exp is a dictionary
-                if not isinstance(exp, dict):
-                    logger.error(f"Experience entry {i+1} must be a dictionary, got {type(exp).__name__}: {exp}")
-                    logger.error("Expected format: - company: 'Company Name'\\n  role: 'Job Title'\\n  start_date: 'YYYY-MM'\\n  end_date: 'YYYY-MM' or 'Present'")
-                    continue
+            for exp in experiences:
+                # Read each field once up front
+                start_date = exp.get('start_date', '')
+                end_date = exp.get('end_date', 'Present')
+                description = exp.get('description')
+                achievements = exp.get('achievements')
+                technologies = exp.get('technologies')
                 
                 # Job title and company
-                title_company = f"{exp.get('role', '')} - {exp.get('company', '')}"
-                if exp.get('location'):
-                    title_company += f" ({exp['location']})"
-                
-                self.doc.add_heading(title_company, level=3)
+                self._emit(self._format_entry(self._EXP_HEADER, exp, 'location'),
+                           style='Heading 3')
                 
                 # Date range
-                start_date = exp.get('start_date', '')
-                end_date = exp.get('end_date', 'Present')
-                date_range = f"{start_date} - {end_date}"
-                
-                date_para = self.doc.add_paragraph(date_range)
-                date_para.paragraph_format.italic = True
+                self._emit(f"{start_date} - {end_date}", style='CV Italic')
                 
                 # Description
-                if exp.get('description'):
-                    desc_para = self.doc.add_paragraph(exp['description'])
+                if description:
+                    self._emit(description)
                 
                 # Achievements
-                if exp.get('achievements'):
-                    if not isinstance(exp['achievements'], list):
-                        logger.error(f"Experience {i+1}: 'achievements' must be a list, got {type(exp['achievements']).__name__}")
-                        logger.error("Expected format: achievements: ['Achievement 1', 'Achievement 2']")
-                    else:
-                        for achievement in exp['achievements']:
-                            if not isinstance(achievement, str):
-                                logger.error(f"Experience {i+1}: Each achievement must be a string, got {type(achievement).__name__}: {achievement}")
-                                continue
-                            achievement_para = self.doc.add_paragraph(achievement, style='List Bullet')
+                if achievements:
+                    for achievement in achievements:
+                        self._emit(achievement, style='List Bullet')
                 
                 # Technologies
-                if exp.get('technologies'):
-                    if not isinstance(exp['technologies'], list):
-                        logger.error(f"Experience {i+1}: 'technologies' must be a list, got {type(exp['technologies']).__name__}")
-                        logger.error("Expected format: technologies: ['Technology 1', 'Technology 2']")
-                    else:
-                        tech_text = f"Technologies: {', '.join(exp['technologies'])}"
-                        tech_para = self.doc.add_paragraph(tech_text)
-                        tech_para.paragraph_format.italic = True
+                if technologies:
+                    self._emit(self._format_list('Technologies', technologies), style='CV Italic')
                 
                 # Add spacing between jobs
-                self.doc.add_paragraph()
+                self._end_block()
         except Exception as e:
-            logger.error(f"Error processing experience section: {e}")
+            logger.error("Error processing experience section: %s", e)
             logger.error("Make sure experience entries are properly formatted as dictionaries")
             return
         
-        logger.info(f"Added {len(experiences)} work experience entries")
+        logger.info("Added %d work experience entries", len(experiences))
     
     def add_education(self):
         """Add education section."""
-        if 'education' not in self.data:
-            logger.debug("No education found in YAML data")
-            return
-        
-        education_list = self.data['education']
+        education_list = self.data.get('education')
         if not education_list:
+            logger.debug("No education found in YAML data")
             return
         
-        self.doc.add_heading('Education', level=2)
+        self._emit('Education', style='Heading 2')
         
         try:
-            for i, edu in enumerate(education_list):
-                # Check if edu is a dictionary
-                if not isinstance(edu, dict):
-                    logger.error(f"Education entry {i+1} must be a dictionary, got {type(edu).__name__}: {edu}")
-                    logger.error("Expected format: - degree: 'Degree Name'\\n  institution: 'Institution Name'\\n  graduation_date: 'YYYY-MM'")
-                    continue
+            for edu in education_list:
+                # Read each field once up front
+                grad_date = edu.get('graduation_date', '')
+                gpa = edu.get('gpa')
+                honors = edu.get('honors')
+                coursework = edu.get('relevant_coursework')
                 
                 # Degree and institution
-                degree_inst = f"{edu.get('degree', '')} - {edu.get('institution', '')}"
-                if edu.get('location'):
-                    degree_inst += f" ({edu['location']})"
-                
-                self.doc.add_heading(degree_inst, level=3)
+                self._emit(self._format_entry(self._EDU_HEADER, edu, 'location'),
+                           style='Heading 3')
                 
                 # Graduation date
-                grad_date = edu.get('graduation_date', '')
                 if grad_date:
-                    date_para = self.doc.add_paragraph(f"Graduated: {grad_date}")
-                    date_para.paragraph_format.italic = True
+                    self._emit(f"Graduated: {grad_date}", style='CV Italic')
                 
                 # GPA (if provided)
-                if edu.get('gpa'):
-                    gpa_para = self.doc.add_paragraph(f"GPA: {edu['gpa']}")
+                if gpa:
+                    self._emit(f"GPA: {gpa}")
                 
                 # Honors (if provided)
-                if edu.get('honors'):
-                    honors_para = self.doc.add_paragraph(f"Honors: {edu['honors']}")
+                if honors:
+                    self._emit(f"Honors: {honors}")
                 
                 # Relevant coursework
-                if edu.get('relevant_coursework'):
-                    if not isinstance(edu['relevant_coursework'], list):
-                        logger.error(f"Education {i+1}: 'relevant_coursework' must be a list, got {type(edu['relevant_coursework']).__name__}")
-                        logger.error("Expected format: relevant_coursework: ['Course 1', 'Course 2']")
-                    else:
-                        coursework_text = f"Relevant Coursework: {', '.join(edu['relevant_coursework'])}"
-                        coursework_para = self.doc.add_paragraph(coursework_text)
+                if coursework:
+                    self._emit(self._format_list('Relevant Coursework', coursework))
                 
-                self.doc.add_paragraph()
+                self._end_block()
         except Exception as e:
-            logger.error(f"Error processing education section: {e}")
+            logger.error("Error processing education section: %s", e)
             logger.error("Make sure education entries are properly formatted as dictionaries")
             return
         
-        logger.info(f"Added {len(education_list)} education entries")
+        logger.info("Added %d education entries", len(education_list))
     
     def add_skills(self):
         """Add skills section."""
-        if 'skills' not in self.data:
+        skills = self.data.get('skills') or {}
+        # Skip categories without skills, and the whole section if none are left
+        categories = [(category, skill_list) for category, skill_list in skills.items() if skill_list]
+        if not categories:
             logger.debug("No skills found in YAML data")
             return
         
-        skills = self.data['skills']
-        if not skills:
-            return
-        
-        self.doc.add_heading('Skills', level=2)
+        self._emit('Skills', style='Heading 2')
         
-        for category, skill_list in skills.items():
-            if skill_list:
-                # Format category name (replace underscores with spaces, title case)
-                category_name = category.replace('_', ' ').title()
-                self.doc.add_heading(category_name, level=3)
-                
-                # Add skills as comma-separated list
-                skills_text = ', '.join(skill_list)
-                skills_para = self.doc.add_paragraph(skills_text)
+        for category, skill_list in categories:
+            # Format category name (replace underscores with spaces, title case)
+            category_name = category.replace('_', ' ').title()
+            self._emit(category_name, style='Heading 3')
+            
+            # Add skills as comma-separated list
+            self._emit(self._format_list(None, skill_list))
         
         logger.info("Added skills section")
     
     def add_certifications(self):
         """Add certifications section."""
-        if 'certifications' not in self.data:
+        certs = self.data.get('certifications')
+        if not certs:
             logger.debug("No certifications found in YAML data")
             return
         
-        certs = self.data['certifications']
-        if not certs or certs is None:
-            return
-        
-        self.doc.add_heading('Certifications', level=2)
+        self._emit('Certifications', style='Heading 2')
         
         try:
-            for i, cert in enumerate(certs):
-                # Check if cert is a dictionary
-                if not isinstance(cert, dict):
-                    logger.error(f"Certification entry {i+1} must be a dictionary, got {type(cert).__name__}: {cert}")
-                    logger.error("Expected format: - name: 'Certification Name'\\n  issuer: 'Issuing Organization'\\n  date: 'YYYY-MM'")
-                    continue
+            for cert in certs:
+                self._emit(self._format_entry(self._CERT_HEADER, cert, 'date'))
                 
-                cert_text = f"{cert.get('name', '')} - {cert.get('issuer', '')}"
-                if cert.get('date'):
-                    cert_text += f" ({cert['date']})"
-                
-                cert_para = self.doc.add_paragraph(cert_text)
-                
-                if cert.get('credential_id'):
-                    id_para = self.doc.add_paragraph(f"Credential ID: {cert['credential_id']}")
-                    id_para.paragraph_format.italic = True
+                credential_id = cert.get('credential_id')
+                if credential_id:
+                    self._emit(f"Credential ID: {credential_id}", style='CV Italic')
         except Exception as e:
-            logger.error(f"Error processing certifications section: {e}")
+            logger.error("Error processing certifications section: %s", e)
             logger.error("Make sure certification entries are properly formatted as dictionaries")
             return
         
-        logger.info(f"Added {len(certs)} certifications")
+        logger.info("Added %d certifications", len(certs))
     
     def add_projects(self):
         """Add projects section."""
-        if 'projects' not in self.data:
-            logger.debug("No projects found in YAML data")
-            return
-        
-        projects = self.data['projects']
+        projects = self.data.get('projects')
         if not projects:
+            logger.debug("No projects found in YAML data")
             return
         
-        self.doc.add_heading('Projects', level=2)
+        self._emit('Projects', style='Heading 2')
         
         try:
-            for i, project in enumerate(projects):
-                # Check if project is a dictionary
-                if not isinstance(project, dict):
-                    logger.error(f"Project entry {i+1} must be a dictionary, got {type(project).__name__}: {project}")
-                    logger.error("Expected format: - name: 'Project Name'\\n  description: 'Description'\\n  technologies: ['Tech 1', 'Tech 2']")
-                    continue
+            for project in projects:
+                # Read each field once up front
+                description = project.get('description')
+                technologies = project.get('technologies')
+                url = project.get('url')
+                date = project.get('date')
                 
                 # Project name
-                self.doc.add_heading(project.get('name', ''), level=3)
+                self._emit(project.get('name', ''), style='Heading 3')
                 
                 # Description
-                if project.get('description'):
-                    desc_para = self.doc.add_paragraph(project['description'])
+                if description:
+                    self._emit(description)
                 
                 # Technologies
-                if project.get('technologies'):
-                    if not isinstance(project['technologies'], list):
-                        logger.error(f"Project {i+1}: 'technologies' must be a list, got {type(project['technologies']).__name__}")
-                        logger.error("Expected format: technologies: ['Technology 1', 'Technology 2']")
-                    else:
-                        tech_text = f"Technologies: {', '.join(project['technologies'])}"
-                        tech_para = self.doc.add_paragraph(tech_text)
-                        tech_para.paragraph_format.italic = True
+                if technologies:
+                    self._emit(self._format_list('Technologies', technologies), style='CV Italic')
                 
                 # URL (if provided)
-                if project.get('url'):
-                    url_para = self.doc.add_paragraph()
+                if url:
                     # Add hyperlink for project URL
-                    self._add_hyperlink_simple(url_para, f"URL: {project['url']}", project['url'])
+                    self._add_hyperlink_simple(f"URL: {url}", url)
                 
                 # Date (if provided)
-                if project.get('date'):
-                    date_para = self.doc.add_paragraph(f"Date: {project['date']}")
+                if date:
+                    self._emit(f"Date: {date}")
                 
-                self.doc.add_paragraph()
+                self._end_block()
         except Exception as e:
-            logger.error(f"Error processing projects section: {e}")
+            logger.error("Error processing projects section: %s", e)
             logger.error("Make sure project entries are properly formatted as dictionaries")
             return
         
-        logger.info(f"Added {len(projects)} projects")
+        logger.info("Added %d projects", len(projects))
     
     def add_languages(self):
         """Add languages section."""
-        if 'languages' not in self.data:
-            logger.debug("No languages found in YAML data")
-            return
-        
-        languages = self.data['languages']
+        languages = self.data.get('languages')
         if not languages:
+            logger.debug("No languages found in YAML data")
             return
         
-        self.doc.add_heading('Languages', level=2)
+        self._emit('Languages', style='Heading 2')
         
         try:
             for lang in languages:
-                # Check if lang is a dictionary
-                if not isinstance(lang, dict):
-                    logger.error(f"Language entry must be a dictionary, got {type(lang).__name__}: {lang}")
-                    logger.error("Expected format: - language: 'Language Name'\\n  proficiency: 'Proficiency Level'")
-                    continue
-                
-                lang_text = f"{lang.get('language', '')} - {lang.get('proficiency', '')}"
-                lang_para = self.doc.add_paragraph(lang_text)
+                self._emit(self._format_entry(self._LANG_LINE, lang))
         except Exception as e:
-            logger.error(f"Error processing languages section: {e}")
+            logger.error("Error processing languages section: %s", e)
             logger.error("Make sure language entries are properly formatted as dictionaries")
             return
         
-        logger.info(f"Added {len(languages)} languages")
+        logger.info("Added %d languages", len(languages))
     
     def add_additional_sections(self):
         """Add additional sections like volunteer work, publications, etc."""
-        if 'additional_sections' not in self.data:
+        additional = self.data.get('additional_sections')
+        if not additional:
             logger.debug("No additional sections found in YAML data")
             return
         
-        additional = self.data['additional_sections']
-        
         # Volunteer work
-        if 'volunteer' in additional and additional['volunteer']:
-            self.doc.add_heading('Volunteer Experience', level=2)
+        volunteer = additional.get('volunteer')
+        if volunteer:
+            self._emit('Volunteer Experience', style='Heading 2')
             try:
-                for vol in additional['volunteer']:
-                    # Check if vol is a dictionary
-                    if not isinstance(vol, dict):
-                        logger.error(f"Volunteer entry must be a dictionary, got {type(vol).__name__}: {vol}")
-                        logger.error("Expected format: - role: 'Role Name'\\n  organization: 'Organization'\\n  duration: 'Duration'")
-                        continue
-                    
-                    vol_text = f"{vol.get('role', '')} - {vol.get('organization', '')}"
-                    if vol.get('duration'):
-                        vol_text += f" ({vol['duration']})"
-                    
-                    self.doc.add_heading(vol_text, level=3)
-                    if vol.get('description'):
-                        desc_para = self.doc.add_paragraph(vol['description'])
-                    self.doc.add_paragraph()
+                for vol in volunteer:
+                    self._emit(self._format_entry(self._VOL_HEADER, vol, 'duration'),
+                               style='Heading 3')
+                    description = vol.get('description')
+                    if description:
+                        self._emit(description)
+                    self._end_block()
             except Exception as e:
-                logger.error(f"Error processing volunteer section: {e}")
+                logger.error("Error processing volunteer section: %s", e)
                 logger.error("Make sure volunteer entries are properly formatted as dictionaries")
         
         # Publications
-        if 'publications' in additional and additional['publications']:
-            self.doc.add_heading('Publications', level=2)
+        publications = additional.get('publications')
+        if publications:
+            self._emit('Publications', style='Heading 2')
             try:
-                for pub in additional['publications']:
-                    # Check if pub is a dictionary
-                    if not isinstance(pub, dict):
-                        logger.error(f"Publication entry must be a dictionary, got {type(pub).__name__}: {pub}")
-                        logger.error("Expected format: - title: 'Title'\\n  publication: 'Publication Name'\\n  date: 'Date'")
-                        continue
-                    
-                    pub_text = f"{pub.get('title', '')} - {pub.get('publication', '')}"
-                    if pub.get('date'):
-                        pub_text += f" ({pub['date']})"
-                    
-                    self.doc.add_heading(pub_text, level=3)
-                    if pub.get('url'):
-                        url_para = self.doc.add_paragraph()
+                for pub in publications:
+                    self._emit(self._format_entry(self._PUB_HEADER, pub, 'date'),
+                               style='Heading 3')
+                    url = pub.get('url')
+                    if url:
                         # Add hyperlink for publication URL
-                        self._add_hyperlink_simple(url_para, f"URL: {pub['url']}", pub['url'])
-                    self.doc.add_paragraph()
+                        self._add_hyperlink_simple(f"URL: {url}", url)
+                    self._end_block()
             except Exception as e:
-                logger.error(f"Error processing publications section: {e}")
+                logger.error("Error processing publications section: %s", e)
                 logger.error("Make sure publication entries are properly formatted as dictionaries")
         
         logger.info("Added additional sections")
@@ -735,27 +1246,27 @@ class CVGenerator:
         
         logger.info("Adding secret message (white text)")
         
-        # Add a paragraph with white text
-        secret_para = self.doc.add_paragraph()
+        # Add a paragraph with white text, tagged with its own style so the
+        # HTML export can recognise it without inspecting run colours
+        secret_style = self.doc.styles.add_style(SECRET_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+        secret_style.base_style = self.doc.styles['Normal']
+        secret_para = self.doc.add_paragraph(style=secret_style)
         secret_run = secret_para.add_run(secret_message)
         
         # Set font color to white (RGB 255, 255, 255) - invisible on white background
-        secret_run.font.color.rgb = RGBColor(255, 255, 255)
+        secret_run.font.color.rgb = WHITE
         
         # Use same font as the rest of the document for consistency
-        font_family = self.config.get('font_family', 'Arial')
-        font_size = self.config.get('font_size', 11)
-        secret_run.font.name = font_family
-        secret_run.font.size = Pt(font_size)
+        secret_run.font.name = self.config.get('font_family', 'Arial')
         
         # Make it very small to avoid layout issues (optional, but helps)
-        secret_run.font.size = Pt(1)
+        secret_run.font.size = SECRET_FONT_SIZE
         
         # Add minimal spacing
-        secret_para.paragraph_format.space_after = Pt(0)
-        secret_para.paragraph_format.space_before = Pt(0)
+        secret_para.paragraph_format.space_after = NO_SPACE
+        secret_para.paragraph_format.space_before = NO_SPACE
         
-        logger.debug(f"Secret message added: {len(secret_message)} characters")
+        logger.debug("Secret message added: %d characters", len(secret_message))
     
     def apply_formatting(self):
         """Apply ATS-friendly formatting to the document."""
@@ -766,57 +1277,82 @@ class CVGenerator:
         font_family = self.config.get('font_family', 'Arial')
         font_size = self.config.get('font_size', 11)
         
-        # Apply formatting to all paragraphs
-        for paragraph in self.doc.paragraphs:
-            for run in paragraph.runs:
-                run.font.name = font_family
-                run.font.size = Pt(font_size)
-            
-            # Add proper spacing after headings
-            if paragraph.style.name.startswith('Heading'):
-                paragraph.paragraph_format.space_after = Pt(6)
-            else:
-                paragraph.paragraph_format.space_after = Pt(3)
+        # Set fonts and spacing on the styles once; every paragraph inherits them
+        normal = self.doc.styles['Normal']
+        if normal.font.name == font_family and normal.font.size == Pt(font_size):
+            logger.debug("Formatting already applied: %s, %spt", font_family, font_size)
+            return
         
-        logger.debug(f"Applied formatting: {font_family}, {font_size}pt")
+        self._set_style_font(normal, font_family, font_size)
+        normal.paragraph_format.space_after = BODY_SPACE_AFTER
+        
+        for heading in ('Heading 1', 'Heading 2', 'Heading 3'):
+            heading_style = self.doc.styles[heading]
+            self._set_style_font(heading_style, font_family, font_size)
+            heading_style.paragraph_format.space_after = HEADING_SPACE_AFTER
+        
+        logger.debug("Applied formatting: %s, %spt", font_family, font_size)
     
-    def convert_docx_to_pdf(self, docx_path: str) -> str:
+    def _set_style_font(self, style, font_family: str, font_size: int):
+        """
+        Set a single explicit font on a style for all scripts.
+        
+        Theme font references are removed, as they take precedence over
+        explicit font names and would otherwise leave the theme font in place.
+        
+        Args:
+            style: The paragraph style to update
+            font_family: Font name to apply
+            font_size: Font size in points
+        """
+        style.font.name = font_family
+        style.font.size = Pt(font_size)
+        
+        r_fonts = style.element.get_or_add_rPr().get_or_add_rFonts()
+        for theme_attr in THEME_FONT_ATTRS:
+            r_fonts.attrib.pop(theme_attr, None)
+        r_fonts.set(W_EAST_ASIA, font_family)
+        r_fonts.set(W_CS, font_family)
+    
+    def convert_docx_to_pdf(self, docx_path: str, doc: Optional[Document] = None) -> str:
         """
         Convert DOCX file to PDF using available PDF generation libraries.
         
         Args:
             docx_path: Path to the DOCX file to convert
+            doc: The already loaded document, if any; saves reading docx_path back in
             
         Returns:
             str: Path to the generated PDF file, or empty string if conversion failed
         """
-        if not os.path.exists(docx_path):
-            logger.error(f"DOCX file not found: {docx_path}")
+        if doc is None and not os.path.exists(docx_path):
+            logger.error("DOCX file not found: %s", docx_path)
             return ""
         
         # Generate PDF filename
-        pdf_path = docx_path.replace('.docx', '.pdf')
+        pdf_path = str(Path(docx_path).with_suffix('.pdf'))
         
         try:
             # Try WeasyPrint first (better formatting)
-            if WEASYPRINT_AVAILABLE:
+            if WEASYPRINT_AVAILABLE and _import_pdf_backend('weasyprint'):
                 logger.info("Converting DOCX to PDF using WeasyPrint...")
-                return self._convert_with_weasyprint(docx_path, pdf_path)
+                return self._convert_with_weasyprint(docx_path, pdf_path, doc)
             
             # Fallback to pdfkit if WeasyPrint not available
-            elif PDFKIT_AVAILABLE:
+            elif PDFKIT_AVAILABLE and _import_pdf_backend('pdfkit'):
                 logger.info("Converting DOCX to PDF using pdfkit...")
-                return self._convert_with_pdfkit(docx_path, pdf_path)
+                return self._convert_with_pdfkit(docx_path, pdf_path, doc)
             
             else:
                 logger.error("No PDF generation libraries available. Please install weasyprint or pdfkit.")
                 return ""
                 
         except Exception as e:
-            logger.error(f"Error converting DOCX to PDF: {e}")
+            logger.error("Error converting DOCX to PDF: %s", e)
             return ""
     
-    def _convert_with_weasyprint(self, docx_path: str, pdf_path: str) -> str:
+    def _convert_with_weasyprint(self, docx_path: str, pdf_path: str,
+                                 doc: Optional[Document] = None) -> str:
         """
         Convert DOCX to PDF using WeasyPrint.
         This method converts the DOCX to HTML first, then to PDF.
@@ -828,21 +1364,24 @@ class CVGenerator:
             logger.warning("WeasyPrint conversion requires HTML input. Using basic text extraction.")
             
             # Extract text content from DOCX (simplified approach)
-            doc = Document(docx_path)
-            html_content = self._docx_to_html(doc)
+            if doc is None:
+                doc = Document(docx_path)
+            html_content = self._docx_to_html(doc, inline_css=False)
             
-            # Convert HTML to PDF using WeasyPrint
-            html_doc = weasyprint.HTML(string=html_content)
-            html_doc.write_pdf(pdf_path)
+            # Convert HTML to PDF using WeasyPrint, reusing the parsed stylesheet
+            font_config, css = _weasyprint_stylesheet()
+            html_doc = _import_pdf_backend('weasyprint').HTML(string=html_content, base_url='.')
+            html_doc.write_pdf(pdf_path, stylesheets=[css], font_config=font_config)
             
-            logger.info(f"PDF generated successfully: {pdf_path}")
+            logger.info("PDF generated successfully: %s", pdf_path)
             return pdf_path
             
         except Exception as e:
-            logger.error(f"WeasyPrint conversion failed: {e}")
+            logger.error("WeasyPrint conversion failed: %s", e)
             return ""
     
-    def _convert_with_pdfkit(self, docx_path: str, pdf_path: str) -> str:
+    def _convert_with_pdfkit(self, docx_path: str, pdf_path: str,
+                            doc: Optional[Document] = None) -> str:
         """
         Convert DOCX to PDF using pdfkit.
         This method requires wkhtmltopdf to be installed on the system.
@@ -852,7 +1391,8 @@ class CVGenerator:
             logger.warning("pdfkit conversion requires HTML input. Using basic text extraction.")
             
             # Extract text content from DOCX (simplified approach)
-            doc = Document(docx_path)
+            if doc is None:
+                doc = Document(docx_path)
             html_content = self._docx_to_html(doc)
             
             # Configure pdfkit options
@@ -867,218 +1407,90 @@ class CVGenerator:
             }
             
             # Convert HTML to PDF
-            pdfkit.from_string(html_content, pdf_path, options=options)
+            _import_pdf_backend('pdfkit').from_string(html_content, pdf_path, options=options)
             
-            logger.info(f"PDF generated successfully: {pdf_path}")
+            logger.info("PDF generated successfully: %s", pdf_path)
             return pdf_path
             
         except Exception as e:
-            logger.error(f"pdfkit conversion failed: {e}")
+            logger.error("pdfkit conversion failed: %s", e)
             return ""
     
-    def _docx_to_html(self, doc: Document) -> str:
+    def _docx_to_html(self, doc: Document, inline_css: bool = True) -> str:
         """
         Convert a python-docx Document to HTML with enhanced styling.
         This implementation provides better formatting for PDF generation.
+        
+        Args:
+            doc: Document to convert
+            inline_css: Embed the stylesheet in the page; WeasyPrint passes
+                False and applies its cached copy instead
         """
-        html_parts = []
-        html_parts.append("<!DOCTYPE html>")
-        html_parts.append("<html><head>")
-        html_parts.append("<meta charset='UTF-8'>")
-        html_parts.append("<style>")
-        html_parts.append("""
-        body { 
-            font-family: 'Arial', 'Helvetica', sans-serif; 
-            font-size: 11pt; 
-            line-height: 1.5; 
-            margin: 0.8in; 
-            color: #333;
-            background-color: #ffffff;
-        }
-        h1 { 
-            font-size: 24pt; 
-            font-weight: bold; 
-            text-align: center; 
-            margin-bottom: 20pt; 
-            margin-top: 0;
-            color: #2c3e50;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 10pt;
-        }
-        h2 { 
-            font-size: 16pt; 
-            font-weight: bold; 
-            margin-top: 24pt; 
-            margin-bottom: 12pt; 
-            color: #2c3e50;
-            border-left: 4px solid #3498db;
-            padding-left: 10pt;
-        }
-        h3 { 
-            font-size: 13pt; 
-            font-weight: bold; 
-            margin-top: 16pt; 
-            margin-bottom: 8pt; 
-            color: #34495e;
-        }
-        p { 
-            margin-bottom: 8pt; 
-            text-align: justify;
-        }
-        ul { 
-            margin-bottom: 12pt; 
-            padding-left: 20pt;
-        }
-        li { 
-            margin-bottom: 4pt; 
-            line-height: 1.4;
-        }
-        .contact-info {
-            text-align: center;
-            margin-bottom: 20pt;
-            font-size: 10pt;
-            color: #7f8c8d;
-        }
-        .contact-info a {
-            color: #3498db;
-            text-decoration: none;
-        }
-        .contact-info a:hover {
-            text-decoration: underline;
-        }
-        .date-range {
-            font-style: italic;
-            color: #7f8c8d;
-            font-size: 10pt;
-        }
-        .company-role {
-            font-weight: bold;
-            color: #2c3e50;
-        }
-        .achievement {
-            margin-left: 15pt;
-            position: relative;
-        }
-        .achievement:before {
-            content: "•";
-            color: #3498db;
-            font-weight: bold;
-            position: absolute;
-            left: -15pt;
-        }
-        ul {
-            list-style-type: none;
-            padding-left: 0;
-        }
-        .secret-message {
-            color: #ffffff !important;
-            font-size: 1pt;
-            margin: 0;
-            padding: 0;
-            line-height: 0;
-            opacity: 1;
-        }
-        """)
-        html_parts.append("</style>")
-        html_parts.append("</head><body>")
+        buffer = StringIO()
+        write = buffer.write
+        write(HTML_HEAD if inline_css else HTML_HEAD_UNSTYLED)
         
         # Track if we're in a list
         in_list = False
         
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                # Check if this paragraph contains white text (secret message)
-                is_white_text = self._is_white_text(paragraph)
-                
-                # Determine if this is a heading based on style
-                if paragraph.style.name.startswith('Heading 1'):
-                    if in_list:
-                        html_parts.append("</ul>")
-                        in_list = False
-                    html_parts.append(f"<h1>{self._make_links_clickable(paragraph.text)}</h1>")
-                elif paragraph.style.name.startswith('Heading 2'):
-                    if in_list:
-                        html_parts.append("</ul>")
-                        in_list = False
-                    html_parts.append(f"<h2>{self._make_links_clickable(paragraph.text)}</h2>")
-                elif paragraph.style.name.startswith('Heading 3'):
-                    if in_list:
-                        html_parts.append("</ul>")
-                        in_list = False
-                    html_parts.append(f"<h3>{self._make_links_clickable(paragraph.text)}</h3>")
+        # Map paragraph style IDs to names once, so the loop below can read
+        # the body XML directly instead of going through Paragraph wrappers
+        styles = doc.styles
+        default_style = styles.default(WD_STYLE_TYPE.PARAGRAPH)
+        default_name = default_style.name if default_style is not None else 'Normal'
+        style_names = {style.style_id: style.name for style in styles
+                       if style.type == WD_STYLE_TYPE.PARAGRAPH}
+        
+        # Documents generated by this script mark the secret message with its own
+        # style; only older ones need their run colours inspected
+        has_secret_style = SECRET_STYLE in style_names.values()
+        
+        body = doc.element.body
+        for p in body.iterchildren(W_P):
+            text = p.text
+            if not text.strip():
+                continue
+            style_name = style_names.get(p.style, default_name)
+            
+            heading_tag = HTML_HEADING_TAGS.get(style_name)
+            if heading_tag:
+                if in_list:
+                    write("</ul>\n")
+                    in_list = False
+                write(f"<{heading_tag}>{_make_links_clickable(text)}</{heading_tag}>\n")
+            # Check if it's a bullet point
+            elif style_name == 'List Bullet':
+                if not in_list:
+                    write("<ul>\n")
+                    in_list = True
+                write(f"<li class='achievement'>{_make_links_clickable(text)}</li>\n")
+            else:
+                if in_list:
+                    write("</ul>\n")
+                    in_list = False
+                # Check if this is white text (secret message)
+                if has_secret_style:
+                    is_white_text = style_name == SECRET_STYLE
                 else:
-                    # Check if it's a bullet point
-                    if paragraph.style.name == 'List Bullet':
-                        if not in_list:
-                            html_parts.append("<ul>")
-                            in_list = True
-                        html_parts.append(f"<li class='achievement'>{self._make_links_clickable(paragraph.text)}</li>")
-                    else:
-                        if in_list:
-                            html_parts.append("</ul>")
-                            in_list = False
-                        # Check if this is white text (secret message)
-                        if is_white_text:
-                            html_parts.append(f"<p class='secret-message'>{paragraph.text}</p>")
-                        # Check if this looks like a date range
-                        elif self._is_date_range(paragraph.text):
-                            html_parts.append(f"<p class='date-range'>{paragraph.text}</p>")
-                        else:
-                            html_parts.append(f"<p>{self._make_links_clickable(paragraph.text)}</p>")
+                    is_white_text = self._is_white_text(Paragraph(p, doc._body))
+                if is_white_text:
+                    write(f"<p class='secret-message'>{text}</p>\n")
+                # Centered contact block: one line per contact detail
+                elif p.alignment == CENTER:
+                    lines = [_make_links_clickable(line) for line in text.split('\n')]
+                    write(f"<p class='contact-info'>{'<br>'.join(lines)}</p>\n")
+                # Check if this looks like a date range
+                elif _is_date_range(text):
+                    write(f"<p class='date-range'>{text}</p>\n")
+                else:
+                    write(f"<p>{_make_links_clickable(text)}</p>\n")
         
         # Close any remaining list
         if in_list:
-            html_parts.append("</ul>")
-        
-        html_parts.append("</body></html>")
-        return "\n".join(html_parts)
-    
-    def _make_links_clickable(self, text: str) -> str:
-        """
-        Convert email addresses, phone numbers, and URLs to clickable links.
-        """
-        import re
-        
-        # Email addresses
-        text = re.sub(r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', 
-                      r'<a href="mailto:\1">\1</a>', text)
-        
-        # Phone numbers (various formats) - be more specific to avoid false matches
-        text = re.sub(r'(\+?[\d\s\-\(\)]{10,})', 
-                      r'<a href="tel:\1">\1</a>', text)
-        
-        # URLs (http/https) - be more specific
-        text = re.sub(r'(https?://[^\s<>"]+)', 
-                      r'<a href="\1" target="_blank">\1</a>', text)
-        
-        # LinkedIn URLs - handle both with and without https
-        text = re.sub(r'LinkedIn:\s*(https?://[^\s<>"]+)', 
-                      r'LinkedIn: <a href="\1" target="_blank">\1</a>', text)
-        text = re.sub(r'LinkedIn:\s*([^\s<>"]+)', 
-                      r'LinkedIn: <a href="https://\1" target="_blank">\1</a>', text)
-        
-        # GitHub URLs - handle both with and without https
-        text = re.sub(r'GitHub:\s*(https?://[^\s<>"]+)', 
-                      r'GitHub: <a href="\1" target="_blank">\1</a>', text)
-        text = re.sub(r'GitHub:\s*([^\s<>"]+)', 
-                      r'GitHub: <a href="https://\1" target="_blank">\1</a>', text)
-        
-        # Website URLs - handle both with and without https
-        text = re.sub(r'Website:\s*(https?://[^\s<>"]+)', 
-                      r'Website: <a href="\1" target="_blank">\1</a>', text)
-        text = re.sub(r'Website:\s*([^\s<>"]+)', 
-                      r'Website: <a href="https://\1" target="_blank">\1</a>', text)
+            write("</ul>\n")
         
-        return text
-    
-    def _is_date_range(self, text: str) -> bool:
-        """
-        Check if text looks like a date range (e.g., "2024-10 - Present").
-        """
-        import re
-        # Pattern for date ranges like "2024-10 - Present" or "2023-01 - 2024-12"
-        date_pattern = r'\d{4}-\d{2}\s*-\s*(Present|\d{4}-\d{2})'
-        return bool(re.match(date_pattern, text.strip()))
+        write(HTML_TAIL)
+        return buffer.getvalue()
     
     def _is_white_text(self, paragraph) -> bool:
         """
@@ -1096,11 +1508,11 @@ class CVGenerator:
                 # Check if the run has a color set
                 if run.font.color.rgb:
                     # Check if color is white (RGB 255, 255, 255)
-                    if run.font.color.rgb == RGBColor(255, 255, 255):
+                    if run.font.color.rgb == WHITE:
                         return True
             return False
         except Exception as e:
-            logger.debug(f"Error checking for white text: {e}")
+            logger.debug("Error checking for white text: %s", e)
             return False
     
     def generate_filename(self) -> str:
@@ -1118,38 +1530,88 @@ class CVGenerator:
         
         # Add timestamp if configured
         if self.config.get('include_timestamp', True):
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"{prefix}_{timestamp}.docx"
+            filename = f"{prefix}_{self._timestamp}.docx"
         else:
             filename = f"{prefix}.docx"
         
         return filename
     
+    def save_to_bytes(self) -> bytes:
+        """
+        Serialize the document to DOCX bytes in memory.
+        
+        Parts are stored uncompressed when compression is turned off on the
+        command line or via cv_config.fast_save.
+        
+        Returns:
+            bytes: The complete DOCX package
+        """
+        buffer = BytesIO()
+        if self.compress and not self.config.get('fast_save', False):
+            self.doc.save(buffer)
+            return buffer.getvalue()
+        
+        try:
+            self._save_uncompressed(buffer)
+        except (AttributeError, TypeError) as e:
+            # The uncompressed writer relies on python-docx internals; if they
+            # changed, a compressed but correct document beats a failed save
+            logger.warning("Uncompressed save not supported by this python-docx version (%s); "
+                           "saving compressed instead", e)
+            buffer = BytesIO()
+            self.doc.save(buffer)
+        return buffer.getvalue()
+    
+    def _save_uncompressed(self, target):
+        """
+        Save the document as a ZIP_STORED package, skipping the DEFLATE pass.
+        
+        Mirrors python-docx's package writer, which always compresses. This is
+        the only place that uses python-docx's private API, namely
+        PackageWriter's _write_content_types_stream, _write_pkg_rels and
+        _write_parts; test_cv.py round-trips an uncompressed save to catch
+        changes to them.
+        
+        Args:
+            target: Path or binary file object to write the DOCX package to
+            
+        Raises:
+            AttributeError: If the PackageWriter internals are not available
+        """
+        missing = [name for name in PACKAGE_WRITER_INTERNALS if not hasattr(PackageWriter, name)]
+        if missing:
+            raise AttributeError(f"PackageWriter has no {', '.join(missing)}")
+        
+        package = self.doc.part.package
+        for part in package.parts:
+            part.before_marshal()
+        
+        with zipfile.ZipFile(target, 'w', zipfile.ZIP_STORED) as zip_file:
+            writer = SimpleNamespace(write=lambda pack_uri, blob: zip_file.writestr(pack_uri.membername, blob))
+            PackageWriter._write_content_types_stream(writer, package.parts)
+            PackageWriter._write_pkg_rels(writer, package.rels)
+            PackageWriter._write_parts(writer, package.parts)
+    
     def save_document(self) -> str:
         """Save the document to the output folder and generate PDF."""
         if not self.doc:
             logger.error("No document to save")
             return ""
         
-        # Create output directory if it doesn't exist
-        output_dir = Path("output")
-        output_dir.mkdir(exist_ok=True)
-        
         # Generate filename
-        filename = self.generate_filename()
-        filepath = output_dir / filename
+        filepath = self._output_dir / self.generate_filename()
         
         try:
-            # Save DOCX file
-            self.doc.save(str(filepath))
-            logger.info(f"CV saved successfully: {filepath}")
+            # Serialize in memory first, so a failed save never leaves a partial file behind
+            filepath.write_bytes(self.save_to_bytes())
+            logger.info("CV saved successfully: %s", filepath)
             
             # Generate PDF if PDF generation is available
             if WEASYPRINT_AVAILABLE or PDFKIT_AVAILABLE:
                 logger.info("Generating PDF version...")
-                pdf_path = self.convert_docx_to_pdf(str(filepath))
+                pdf_path = self.convert_docx_to_pdf(str(filepath), doc=self.doc)
                 if pdf_path:
-                    logger.info(f"PDF generated successfully: {pdf_path}")
+                    logger.info("PDF generated successfully: %s", pdf_path)
                 else:
                     logger.warning("PDF generation failed, but DOCX was saved successfully")
             else:
@@ -1157,9 +1619,29 @@ class CVGenerator:
             
             return str(filepath)
         except Exception as e:
-            logger.error(f"Error saving document: {e}")
+            logger.error("Error saving document: %s", e)
             return ""
     
+    def _section_pipeline(self) -> List:
+        """
+        Resolve the configured section order to the methods that render it.
+        
+        Unknown and hidden sections are dropped here, so generate_cv only
+        has to call the returned methods in order.
+        
+        Returns:
+            list: Bound section methods in rendering order
+        """
+        hidden_sections = frozenset(self.config.get('hidden_sections') or ())
+        section_order = self.config.get('section_order')
+        if section_order is None:
+            sections = self._SECTIONS
+        else:
+            sections = [(section, self._SECTION_METHOD_NAMES.get(section)) for section in section_order]
+        
+        return [getattr(self, method_name) for section, method_name in sections
+                if method_name and section not in hidden_sections]
+    
     def generate_cv(self) -> bool:
         """
         Generate the complete CV document.
@@ -1177,29 +1659,12 @@ class CVGenerator:
             # Create document
             self.create_document()
             
-            # Add sections in order
-            section_order = self.config.get('section_order', [
-                'personal_info', 'summary', 'experience', 'education', 
-                'skills', 'certifications', 'projects', 'languages', 'additional_sections'
-            ])
-            
-            # Map section names to methods
-            section_methods = {
-                'personal_info': self.add_personal_info,
-                'summary': self.add_summary,
-                'experience': self.add_experience,
-                'education': self.add_education,
-                'skills': self.add_skills,
-                'certifications': self.add_certifications,
-                'projects': self.add_projects,
-                'languages': self.add_languages,
-                'additional_sections': self.add_additional_sections
-            }
+            # Add sections in configured order, skipping hidden ones
+            for add_section in self._section_pipeline():
+                add_section()
             
-            # Add sections in configured order
-            for section in section_order:
-                if section in section_methods and section not in self.config.get('hidden_sections', []):
-                    section_methods[section]()
+            # Write the queued section paragraphs to the document body
+            self._flush_paragraphs()
             
             # Add secret message (white text for AI detection) at the end
             self.add_secret_message()
@@ -1216,28 +1681,139 @@ class CVGenerator:
             return True
             
         except Exception as e:
-            logger.error(f"Error during CV generation: {e}")
+            logger.error("Error during CV generation: %s", e)
             return False
+    
+    @classmethod
+    def generate_many(cls, yaml_files: List[str], compress: bool = True,
+                      output_dir: str = "output", max_workers: Optional[int] = None) -> List[bool]:
+        """
+        Generate one CV per YAML file with this class, spread over worker processes.
+        
+        Each CV is written to a subdirectory of output_dir named after its YAML
+        file, so variants sharing a name and timestamp don't overwrite each other.
+        YAML files with the same name in different directories get their
+        1-based position in yaml_files appended (cv_1, cv_2).
+        
+        Args:
+            yaml_files: Paths to YAML files containing CV data
+            compress: Write the DOCX files with DEFLATE compression
+            output_dir: Directory the per-file subdirectories are created in
+            max_workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            List[bool]: Success flag for each YAML file, in input order
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        
+        stems = [Path(yaml_file).stem for yaml_file in yaml_files]
+        stem_counts = Counter(stems)
+        jobs = []
+        for position, (yaml_file, stem) in enumerate(zip(yaml_files, stems), 1):
+            subdir = stem if stem_counts[stem] == 1 else f"{stem}_{position}"
+            jobs.append((cls, yaml_file, compress, str(Path(output_dir) / subdir)))
+        if len(jobs) == 1:
+            return [_generate_one(jobs[0])]
+        
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+            return list(executor.map(_generate_one, jobs))
 
 
-def main():
-    """Main function to run the CV generator."""
+def _init_worker():
+    """
+    Set up logging in a generate_many worker process.
+    
+    A forked worker inherits the parent's buffered log records; drop them so
+    they are not written to the log file a second time by the worker.
+    """
+    _log_buffer.acquire()
+    try:
+        _log_buffer.buffer.clear()
+    finally:
+        _log_buffer.release()
+
+
+def _generate_one(job: tuple) -> bool:
+    """Worker for CVGenerator.generate_many: generate the CV for one (generator class, yaml_file, compress, output_dir) job."""
+    generator_cls, yaml_file, compress, output_dir = job
+    try:
+        return generator_cls(yaml_file, compress=compress, output_dir=output_dir).generate_cv()
+    finally:
+        # Pool workers exit without logging.shutdown, which would lose buffered records
+        _log_buffer.flush()
+
+
+# Command line flags: value-taking options with their defaults, then boolean switches
+CLI_OPTIONS = {'--yaml-file': 'data/master_cv.yaml', '--output-dir': 'output'}
+CLI_SWITCHES = ('--no-compress', '--export-json')
+
+
+def parse_args(argv: List[str]) -> SimpleNamespace:
+    """
+    Parse command line arguments without importing argparse.
+    
+    Only --help or malformed input fall back to argparse, which then prints
+    the usage text or the error message and exits.
+    
+    Args:
+        argv: Arguments without the program name
+        
+    Returns:
+        SimpleNamespace: Parsed options (yaml_file, output_dir, no_compress, export_json)
+    """
+    values = dict(CLI_OPTIONS)
+    values.update(dict.fromkeys(CLI_SWITCHES, False))
+    
+    i = 0
+    while i < len(argv):
+        flag, sep, value = argv[i].partition('=')
+        i += 1
+        if flag in CLI_OPTIONS:
+            if not sep:
+                if i == len(argv) or argv[i].startswith('-'):
+                    return _parse_args_verbose(argv)
+                value = argv[i]
+                i += 1
+            values[flag] = value
+        elif flag in CLI_SWITCHES and not sep:
+            values[flag] = True
+        else:
+            return _parse_args_verbose(argv)
+    
+    return SimpleNamespace(**{flag[2:].replace('-', '_'): value for flag, value in values.items()})
+
+
+def _parse_args_verbose(argv: List[str]) -> SimpleNamespace:
+    """Parse arguments with argparse, for --help output and error reporting."""
     import argparse
     
     parser = argparse.ArgumentParser(description='Generate CV from YAML data')
-    parser.add_argument('--yaml-file', default='data/master_cv.yaml',
+    parser.add_argument('--yaml-file', default=CLI_OPTIONS['--yaml-file'],
                        help='Path to YAML file containing CV data')
-    parser.add_argument('--output-dir', default='output',
+    parser.add_argument('--output-dir', default=CLI_OPTIONS['--output-dir'],
                        help='Output directory for generated CV')
+    parser.add_argument('--no-compress', action='store_true',
+                       help='Store the DOCX uncompressed for faster saves during development')
+    parser.add_argument('--export-json', action='store_true',
+                       help='Write the CV data to a JSON file next to the YAML file for faster later runs')
     
-    args = parser.parse_args()
+    return SimpleNamespace(**vars(parser.parse_args(argv)))
+
+
+def main():
+    """Main function to run the CV generator."""
+    args = parse_args(sys.argv[1:])
     
     # Initialize generator
-    generator = CVGenerator(args.yaml_file)
+    generator = CVGenerator(args.yaml_file, compress=not args.no_compress,
+                            output_dir=args.output_dir)
     
     # Generate CV
     success = generator.generate_cv()
     
+    if success and args.export_json:
+        generator.export_json()
+    
     if success:
         logger.info("CV generation completed successfully!")
         sys.exit(0)
@@ -29,7 +29,14 @@ def main():
         print(f"❌ Missing dependencies: {e}")
         print("Please run: pip install -r requirements.txt")
         sys.exit(1)
-    
+
+    # The CV is parsed with PyYAML's libyaml bindings when they are available
+    if hasattr(yaml, 'CSafeLoader'):
+        print("✅ libyaml bindings found (fast YAML parsing)")
+    else:
+        print("⚠️  PyYAML was built without libyaml; YAML parsing will be slower")
+        print("   Install libyaml (e.g. libyaml-dev) and reinstall PyYAML to enable it")
+
     # Check if example file exists
     example_file = Path("data/example_cv.yaml")
     if not example_file.exists():
@@ -6,6 +6,8 @@ Verifies that the generated CV contains expected content and formatting.
 
 import os
 import sys
+import tempfile
+import zipfile
 from pathlib import Path
 from docx import Document
 
@@ -86,6 +88,42 @@ def test_cv_structure(filepath):
         print(f"❌ Error reading CV: {e}")
         return False
 
+def test_uncompressed_save():
+    """Test that a CV saved without compression (--no-compress / fast_save) opens correctly."""
+    print("\nTesting uncompressed DOCX save")
+    print("-" * 50)
+    
+    # The uncompressed writer uses python-docx internals, so check the real output
+    from generate_cv import CVGenerator
+    os.environ.setdefault('CV_NAME', 'John Doe')
+    os.environ.setdefault('CV_EMAIL', 'john.doe@email.com')
+    
+    try:
+        with tempfile.TemporaryDirectory() as output_dir:
+            example_file = Path(__file__).parent / "data" / "example_cv.yaml"
+            generator = CVGenerator(str(example_file), compress=False, output_dir=output_dir)
+            if not generator.generate_cv():
+                print("❌ CV generation without compression failed")
+                return False
+            
+            cv_file = next(Path(output_dir).glob("*.docx"))
+            with zipfile.ZipFile(cv_file) as package:
+                if any(info.compress_type != zipfile.ZIP_STORED for info in package.infolist()):
+                    print("❌ DOCX parts are compressed")
+                    return False
+            print("✅ DOCX parts are stored uncompressed")
+            
+            expected = [p.text for p in generator.doc.paragraphs]
+            if [p.text for p in Document(str(cv_file)).paragraphs] != expected:
+                print("❌ Uncompressed CV content differs from the generated document")
+                return False
+            print("✅ Uncompressed CV opened with matching content")
+            return True
+    
+    except Exception as e:
+        print(f"❌ Error testing uncompressed save: {e}")
+        return False
+
 def main():
     """Main test function."""
     print("CV Automation System - Test Suite")
@@ -109,6 +147,7 @@ def main():
     
     # Run tests
     success = test_cv_structure(str(latest_cv))
+    success = test_uncompressed_save() and success
     
     if success:
         print("\n🎉 All tests passed! CV generation is working correctly.")